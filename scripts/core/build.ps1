@@ -47,7 +47,7 @@ switch ($Command) {
         Execute-Command "dotnet build BlockLife.sln --configuration Debug"
         Write-Host "✓ Build successful" -ForegroundColor Green
         Write-Step "Running tests"
-        Execute-Command "dotnet test BlockLife.sln --configuration Debug --verbosity normal"
+        Execute-Command "dotnet test BlockLife.sln --configuration Debug --no-build --verbosity normal"
         Write-Host "✓ Build and test complete - safe to commit" -ForegroundColor Green
         Write-Host "  💡 Tip: For faster testing, use ../test/quick.ps1 (1.3s) or ../test/full.ps1 (staged)" -ForegroundColor DarkGray
     }
@@ -43,7 +43,7 @@ case $command in
         execute_command "dotnet build BlockLife.sln --configuration Debug"
         echo -e "${GREEN}✓ Build successful${NC}"
         write_step "Running tests"
-        execute_command "dotnet test BlockLife.sln --configuration Debug --verbosity normal"
+        execute_command "dotnet test BlockLife.sln --configuration Debug --no-build --verbosity normal"
         echo -e "${GREEN}✓ Build and test complete - safe to commit${NC}"
         ;;
         
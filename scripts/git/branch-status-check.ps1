@@ -79,8 +79,10 @@ git fetch origin main --quiet 2>$null
 try {
     git rev-parse --verify origin/main >$null 2>&1
     if ($LASTEXITCODE -eq 0) {
-        $behindCount = (git rev-list --count HEAD..origin/main 2>$null) -as [int]
-        $aheadCount = (git rev-list --count origin/main..HEAD 2>$null) -as [int]
+        # One walk for both sides: prints "<behind>`t<ahead>"
+        $behindText, $aheadText = (git rev-list --left-right --count origin/main...HEAD 2>$null) -split '\s+'
+        $behindCount = $behindText -as [int]
+        $aheadCount = $aheadText -as [int]
         
         if ($behindCount -gt 0) {
             Write-Host "   ⚠️  Branch is $behindCount commits behind main" -ForegroundColor Yellow
@@ -80,8 +80,10 @@ echo "   🔄 Checking branch freshness..."
 git fetch origin main --quiet 2>/dev/null
 
 if git rev-parse --verify origin/main >/dev/null 2>&1; then
-    behind_count=$(git rev-list --count HEAD..origin/main 2>/dev/null || echo "0")
-    ahead_count=$(git rev-list --count origin/main..HEAD 2>/dev/null || echo "0")
+    # One walk for both sides: prints "<behind>\t<ahead>"
+    counts=$(git rev-list --left-right --count origin/main...HEAD 2>/dev/null || echo "0 0")
+    behind_count=${counts%%[[:space:]]*}
+    ahead_count=${counts##*[[:space:]]}
     
     if [ "$behind_count" -gt 0 ]; then
         echo "   ⚠️  Branch is $behind_count commits behind main"
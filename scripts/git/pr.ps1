@@ -133,8 +133,7 @@ switch ($Action) {
         # Show sync status
         Write-Host ""
         Write-Host "📊 Sync Status:" -ForegroundColor Cyan
-        $ahead = git rev-list --count origin/main..HEAD
-        $behind = git rev-list --count HEAD..origin/main
+        $behind, $ahead = (git rev-list --left-right --count origin/main...HEAD) -split '\s+'
         
         if ($ahead -eq 0 -and $behind -eq 0) {
             Write-Host "   ✅ Up to date with main" -ForegroundColor Green